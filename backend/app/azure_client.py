@@ -1,11 +1,8 @@
 import os
 from fastapi import HTTPException
-from azure.storage.blob import BlobServiceClient
 
-from azure.ai.formrecognizer import DocumentAnalysisClient
-from azure.core.credentials import AzureKeyCredential
-
-from openai import AzureOpenAI
+# Azure / OpenAI SDKs are imported inside the client factories so importing
+# this module (e.g. from the API for CONTAINER_NAME) stays cheap.
 
 AZURE_CONN_STR = os.getenv("AZURE_CONNECTION_STRING")
 CONTAINER_NAME = os.getenv("AZURE_CONTAINER_NAME", "todo-files")
@@ -21,13 +18,17 @@ def get_blob_service_client():
     
     if not AZURE_CONN_STR:
         raise HTTPException(status_code=500, detail="Azure Connection String not set")
+
+    from azure.storage.blob import BlobServiceClient
     return BlobServiceClient.from_connection_string(AZURE_CONN_STR)
 
 def get_document_analysis_client():
 
     if not DOC_INT_ENDPOINT or not DOC_INT_KEY:
         raise ValueError("Azure Document Intelligence Endpoint or Key not set")
-    
+
+    from azure.ai.formrecognizer import DocumentAnalysisClient
+    from azure.core.credentials import AzureKeyCredential
     return DocumentAnalysisClient(
         endpoint=DOC_INT_ENDPOINT, 
         credential=AzureKeyCredential(DOC_INT_KEY)
@@ -36,7 +37,8 @@ def get_document_analysis_client():
 def get_doc_classified_client():
     if not AZURE_OPENAI_ENDPOINT or not AZURE_INFERENCE_CREDENTIAL:
         raise ValueError("Azure OpenAI Endpoint or Key not set")
-    
+
+    from openai import AzureOpenAI
     client = AzureOpenAI(
         azure_endpoint = AZURE_OPENAI_ENDPOINT,
         api_key=AZURE_INFERENCE_CREDENTIAL,  
@@ -0,0 +1,14 @@
+from celery import Celery
+from app.config import CELERY_BROKER_URL, CELERY_RESULT_BACKEND
+
+# Producer-only client used by the API. Tasks are sent by name, so the API
+# never imports app.worker (and with it openpyxl, Azure and OpenAI SDKs).
+celery_client = Celery(
+    "producer",
+    broker=CELERY_BROKER_URL,
+    backend=CELERY_RESULT_BACKEND
+)
+
+def send_task(name: str, args=None, **options):
+    """Dispatch a worker task by its registered name"""
+    return celery_client.send_task(name, args=args, **options)
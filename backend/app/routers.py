@@ -5,7 +5,7 @@ from typing import List
 from app.database import get_db
 from app import models
 from app import schemas
-from app.worker import create_task, super_delete, process_ocr, process_document_ai
+from app.celery_client import send_task
 
 import os
 from fastapi import UploadFile, File
@@ -66,7 +66,7 @@ def update_todo(id: int, todo_update: schemas.TodoUpdate, db: Session = Depends(
 # 5. SUPER DELETE (DELETE)
 @router.delete("/super_delete", status_code=status.HTTP_202_ACCEPTED)
 def delete_all_todos():
-    super_delete.delay()   # send task to celery
+    send_task("super_delete")   # send task to celery
     return {"message": "Task received, will be completed shortly"}
 
 # 6. DELETE (DELETE)
@@ -85,7 +85,7 @@ def delete_todo(id: int, db: Session = Depends(get_db)):
 @router.post("/background-task", response_model=schemas.TaskDetailResponse)
 def run_background_task(val1: int, val2: int, db: Session = Depends(get_db)):
     #create celery task
-    task = create_task.apply_async(args = [val1,val2], countdown = 2)
+    task = send_task("create_task", args = [val1,val2], countdown = 2)
     
     new_task = models.TaskDetail(
         task_id = task.id,
@@ -165,7 +165,7 @@ async def analyze_document(file: UploadFile = File(...), db: Session = Depends(g
 
     # 3. Trigger Celery Task
     # We pass the filename and the DB ID so the worker knows what to update
-    task = process_ocr.apply_async(args=[file.filename, new_doc.id], countdown=2)
+    task = send_task("process_ocr", args=[file.filename, new_doc.id], countdown=2)
 
     new_task = models.TaskDetail(
         task_id = task.id,
@@ -205,7 +205,7 @@ async def classify_document(file: UploadFile = File(...), db: Session = Depends(
     db.commit()
     db.refresh(new_doc)
 
-    task = process_document_ai.apply_async(args=[file.filename, new_doc.id])
+    task = send_task("process_document_ai", args=[file.filename, new_doc.id])
 
     new_task = models.TaskDetail(
         task_id = task.id,
@@ -6,6 +6,7 @@ from celery.schedules import crontab
 from sqlalchemy import text # Import text for safe SQL execution
 from app.database import SessionLocal
 from app import models
+from app.config import CELERY_BROKER_URL, CELERY_RESULT_BACKEND
 import openpyxl
 
 from app.azure_client import (
@@ -16,13 +17,10 @@ from app.azure_client import (
     AZURE_OPENAI_DEPLOYMENT_NAME
 )
 
-broker_url = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
-result_backend = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
-
 celery_app = Celery(
     "worker",
-    broker=broker_url,
-    backend=result_backend
+    broker=CELERY_BROKER_URL,
+    backend=CELERY_RESULT_BACKEND
 )
 # ---  DEFINE THE SCHEDULE ---
 celery_app.conf.beat_schedule = {
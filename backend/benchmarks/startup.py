@@ -0,0 +1,73 @@
+"""
+Startup benchmark for the API process.
+
+Imports `app.main` in a fresh interpreter (like a new uvicorn replica) and
+reports import time, peak RSS and whether any worker-only heavy modules
+were pulled in.
+
+Run from the backend folder:
+    python benchmarks/startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules the API should never load; they belong to the Celery worker
+HEAVY_MODULES = [
+    "app.worker",
+    "openpyxl",
+    "openai",
+    "azure.storage.blob",
+    "azure.ai.formrecognizer",
+]
+
+PROBE = f"""
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024  # macOS reports bytes
+print(json.dumps({{
+    "import_s": elapsed,
+    "rss_mb": rss_kb / 1024,
+    "heavy": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+def run_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API cold start cost")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+    import_times = [r["import_s"] * 1000 for r in results]
+    rss = [r["rss_mb"] for r in results]
+    heavy = sorted({m for r in results for m in r["heavy"]})
+
+    print(f"runs:            {args.runs}")
+    print(f"import app.main: median {statistics.median(import_times):.1f} ms, max {max(import_times):.1f} ms")
+    print(f"peak RSS:        median {statistics.median(rss):.1f} MB, max {max(rss):.1f} MB")
+    print(f"heavy modules:   {', '.join(heavy) if heavy else 'none'}")
+
+    # Non-zero exit so CI can catch the API importing worker code again
+    return 1 if heavy else 0
+
+if __name__ == "__main__":
+    sys.exit(main())